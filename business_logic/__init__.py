@@ -1,7 +1,7 @@
 # Business Logic Layer
 # This module handles data processing, analysis, and correlation calculations
 
-from .data_processor import DataProcessor, CombinedDataPoint
+from .data_processor import DataProcessor, CombinedDataPoint, SoAView
 from .correlation_analyzer import CorrelationAnalyzer, AnalysisResults
 
-__all__ = ['DataProcessor', 'CombinedDataPoint', 'CorrelationAnalyzer', 'AnalysisResults']
\ No newline at end of file
+__all__ = ['DataProcessor', 'CombinedDataPoint', 'SoAView', 'CorrelationAnalyzer', 'AnalysisResults']
\ No newline at end of file
@@ -0,0 +1,57 @@
+"""
+Vectorized numeric kernels for the business logic layer.
+Each kernel works on whole NumPy arrays so callers avoid per-point Python loops.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+
+def match_days(crypto_days: np.ndarray, moon_days: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the moon point matching each crypto day key with one vectorized binary search.
+    
+    Args:
+        crypto_days: Day keys of the cryptocurrency points
+        moon_days: Sorted day keys of the moon phase points
+    
+    Returns:
+        Tuple of (crypto_indices, moon_indices) for matching days; when a day
+        repeats in moon_days the last occurrence is matched
+    """
+    if len(moon_days) == 0:
+        empty = np.empty(0, np.int64)
+        return empty, empty
+    
+    idx = np.searchsorted(moon_days, crypto_days, side='right') - 1
+    matched = (idx >= 0) & (moon_days[np.maximum(idx, 0)] == crypto_days)
+    crypto_idx = np.flatnonzero(matched)
+    return crypto_idx, idx[crypto_idx]
+
+
+def summarize(is_full_moon: np.ndarray, price_change: np.ndarray) -> Tuple[int, int, int, int, float, int, int]:
+    """
+    Summarize the full moon mask and price change arrays with masked reductions.
+    
+    Args:
+        is_full_moon: Boolean full moon flag per point
+        price_change: Price change per point, NaN where not calculated
+    
+    Returns:
+        Tuple of (total, full_moon_count, with_change_count, full_moon_with_change_count,
+        full_moon_avg_change, full_moon_positive, full_moon_negative); the average is
+        NaN when no full moon day has a price change
+    """
+    has_change = ~np.isnan(price_change)
+    fm_changes = price_change[is_full_moon & has_change]
+    avg = float(fm_changes.mean()) if fm_changes.size else np.nan
+    return (
+        len(price_change),
+        int(np.count_nonzero(is_full_moon)),
+        int(np.count_nonzero(has_change)),
+        fm_changes.size,
+        avg,
+        int(np.count_nonzero(fm_changes > 0)),
+        int(np.count_nonzero(fm_changes < 0))
+    )
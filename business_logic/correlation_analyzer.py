@@ -5,10 +5,14 @@ Implements average calculation for full moon vs normal days with handling for in
 
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
+from itertools import compress
+from operator import not_
 import logging
 from statistics import mean
 
-from business_logic.data_processor import CombinedDataPoint
+import numpy as np
+
+from business_logic.data_processor import CombinedDataPoint, SoAView
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -89,15 +93,11 @@ class CorrelationAnalyzer:
                 total_data_points=len(combined_data)
             )
         
-        # Separate full moon days from normal days
-        full_moon_changes = []
-        normal_day_changes = []
-        
-        for point in valid_data:
-            if point.moon_data.is_full_moon:  # moon_phase > 98%
-                full_moon_changes.append(point.price_change)
-            else:
-                normal_day_changes.append(point.price_change)
+        # Separate full moon days from normal days with one precomputed mask
+        price_changes = [point.price_change for point in valid_data]
+        full_moon_mask = [point.moon_data.is_full_moon for point in valid_data]  # moon_phase > 98%
+        full_moon_changes = list(compress(price_changes, full_moon_mask))
+        normal_day_changes = list(compress(price_changes, map(not_, full_moon_mask)))
         
         # Calculate averages
         full_moon_avg = self._calculate_average(full_moon_changes)
@@ -116,6 +116,53 @@ class CorrelationAnalyzer:
         
         return results
     
+    def analyze_soa(self, view: SoAView) -> AnalysisResults:
+        """
+        Analyze correlation from the processor's columnar arrays in one vectorized pass.
+        
+        Equivalent to analyze_correlation over the same points, but the full moon
+        and normal day split is a pair of boolean masks instead of a per-point loop.
+        
+        Args:
+            view: SoAView of the combined data points with price changes
+            
+        Returns:
+            AnalysisResults object containing statistical analysis
+        """
+        total = len(view.price_change)
+        if total == 0:
+            logger.warning("No data provided for correlation analysis")
+        
+        # A point is usable when it has a price change, a close price and moon data
+        valid = ~(np.isnan(view.price_change) | np.isnan(view.close) | np.isnan(view.phase_pct))
+        valid_count = int(np.count_nonzero(valid))
+        if valid_count == 0:
+            if total:
+                logger.warning("No valid data points with price changes for analysis")
+            return AnalysisResults(
+                full_moon_avg_change=0.0,
+                normal_day_avg_change=0.0,
+                full_moon_count=0,
+                normal_day_count=0,
+                total_data_points=total
+            )
+        
+        full_moon_changes = view.price_change[valid & view.is_full_moon]
+        normal_day_changes = view.price_change[valid & ~view.is_full_moon]
+        
+        results = AnalysisResults(
+            full_moon_avg_change=float(full_moon_changes.mean()) if full_moon_changes.size else 0.0,
+            normal_day_avg_change=float(normal_day_changes.mean()) if normal_day_changes.size else 0.0,
+            full_moon_count=full_moon_changes.size,
+            normal_day_count=normal_day_changes.size,
+            total_data_points=valid_count
+        )
+        
+        logger.info(f"Correlation analysis complete: {full_moon_changes.size} full moon days, "
+                   f"{normal_day_changes.size} normal days")
+        
+        return results
+    
     def _calculate_average(self, values: List[float]) -> float:
         """
         Calculate average of a list of values, handling empty lists.
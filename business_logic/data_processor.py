@@ -4,18 +4,29 @@ Implements data association logic maintaining date-based relationships.
 """
 
 from datetime import datetime, date
-from typing import List, Dict, Optional, Tuple
+from typing import Any, List, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
 from dataclasses import dataclass
+from itertools import groupby
+from operator import attrgetter
+import bisect
 import logging
+import math
+
+import numpy as np
 
 from data_access.bitcoin_client import CryptoPriceData
 from data_access.moon_calculator import MoonPhaseData
+from business_logic._fast import match_days, summarize
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Day ordinal of the datetime64 epoch, and the int64 bit pattern of NaT
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_NAT = np.iinfo(np.int64).min
+
 
-@dataclass
+@dataclass(slots=True)
 class CombinedDataPoint:
     """Combined data point containing cryptocurrency price and moon phase data."""
     date: datetime
@@ -30,13 +41,44 @@ class CombinedDataPoint:
         return self.crypto_data
 
 
+class SoAView(NamedTuple):
+    """Parallel NumPy arrays over the stored combined data points, one entry per point."""
+    dates: np.ndarray  # datetime64[D]
+    close: np.ndarray  # float64
+    volume: np.ndarray  # float64
+    price_change: np.ndarray  # float64, NaN where no change was calculated
+    is_full_moon: np.ndarray  # bool
+    phase_pct: np.ndarray  # float64
+
+
 class DataProcessor:
     """Processor for combining cryptocurrency price data with moon phase calculations."""
     
     def __init__(self):
         """Initialize the data processor."""
         self._combined_data: List[CombinedDataPoint] = []
-        self._data_cache: Dict[date, CombinedDataPoint] = {}
+        self._data_cache: Dict[int, CombinedDataPoint] = {}  # keyed by day ordinal
+        
+        # Columnar (SoA) views of the stored data, aligned with _combined_data
+        self._close_prices: np.ndarray = np.empty(0, dtype=np.float64)
+        self._dates: np.ndarray = np.empty(0, dtype='datetime64[D]')
+        self._price_change: np.ndarray = np.empty(0, dtype=np.float64)
+        self._is_full_moon: np.ndarray = np.empty(0, dtype=bool)
+        self._volumes: np.ndarray = np.empty(0, dtype=np.float64)
+        self._phase_pct: np.ndarray = np.empty(0, dtype=np.float64)
+        
+        # Point dates in stored order, used for binary search when sorted
+        self._sorted_dates: List[datetime] = []
+        self._dates_sorted: bool = True
+        
+        # Identity of the points the cache was last built from
+        self._cached_points: List[CombinedDataPoint] = []
+        self._cache_fingerprint: Optional[Tuple] = None
+        
+        # Version counter bumped whenever the stored points change
+        self._data_version: int = 0
+        self._snapshot: Tuple[CombinedDataPoint, ...] = ()
+        self._snapshot_version: int = 0
     
     def combine_data(self, crypto_data: List[CryptoPriceData], 
                     moon_data: List[MoonPhaseData]) -> List[CombinedDataPoint]:
@@ -61,40 +103,40 @@ class DataProcessor:
             logger.warning("No moon phase data provided for combination")
             return []
         
-        # Create lookup dictionary for moon data by date
-        moon_lookup = {}
-        for moon_point in moon_data:
-            if moon_point and moon_point.date:
-                date_key = moon_point.date.date()
-                moon_lookup[date_key] = moon_point
+        # Drop invalid points up front so the join works on parallel arrays
+        valid_moon = [moon_point for moon_point in moon_data if moon_point and moon_point.date]
+        valid_crypto = [crypto_point for crypto_point in crypto_data if crypto_point and crypto_point.date]
         
-        # Combine data points with matching dates
-        combined_points = []
-        matched_count = 0
+        invalid_count = len(crypto_data) - len(valid_crypto)
+        if invalid_count:
+            logger.warning(f"Skipping {invalid_count} invalid cryptocurrency data points")
         
-        for crypto_point in crypto_data:
-            if not crypto_point or not crypto_point.date:
-                logger.warning("Skipping invalid cryptocurrency data point")
-                continue
-            
-            date_key = crypto_point.date.date()
-            
-            if date_key in moon_lookup:
-                moon_point = moon_lookup[date_key]
-                
-                combined_point = CombinedDataPoint(
-                    date=crypto_point.date,
-                    crypto_data=crypto_point,
-                    moon_data=moon_point
-                )
-                
-                combined_points.append(combined_point)
-                matched_count += 1
-            else:
-                logger.debug(f"No moon data found for cryptocurrency date: {date_key}")
-        
-        # Sort by date
-        combined_points.sort(key=lambda x: x.date)
+        if not valid_crypto or not valid_moon:
+            logger.warning("No valid data points available for combination")
+            return []
+        
+        # Points are emitted in crypto order, so sort to keep the output date-ordered; fetched data already is
+        if any(current.date < previous.date for previous, current in zip(valid_crypto, valid_crypto[1:])):
+            valid_crypto = sorted(valid_crypto, key=attrgetter('date'))
+        
+        # Stable ordering by day keeps the last moon point per date winning the match
+        moon_days = np.fromiter(
+            (moon_point.date.toordinal() for moon_point in valid_moon), dtype=np.int64, count=len(valid_moon)
+        )
+        if np.any(moon_days[1:] < moon_days[:-1]):
+            order = np.argsort(moon_days, kind='stable')
+            valid_moon = [valid_moon[i] for i in order]
+            moon_days = moon_days[order]
+        
+        # Both inputs are already in memory, so join them in one vectorized call
+        crypto_days = np.fromiter(
+            (crypto_point.date.toordinal() for crypto_point in valid_crypto), dtype=np.int64, count=len(valid_crypto)
+        )
+        combined_points = self._join_sorted(valid_crypto, crypto_days, valid_moon, moon_days)
+        matched_count = len(combined_points)
+        
+        if matched_count < len(valid_crypto):
+            logger.debug("No moon data found for %d cryptocurrency dates", len(valid_crypto) - matched_count)
         
         logger.info(f"Combined {matched_count} data points from {len(crypto_data)} cryptocurrency "
                    f"and {len(moon_data)} moon phase data points")
@@ -105,6 +147,105 @@ class DataProcessor:
         
         return combined_points
     
+    def combine_data_chunked(self, crypto_data: Iterable[CryptoPriceData],
+                             moon_data: Iterable[MoonPhaseData],
+                             chunk_days: int = 30) -> Iterator[CombinedDataPoint]:
+        """
+        Lazily combine date-ordered cryptocurrency and moon data in fixed date windows.
+        
+        Only one window of each input is held in memory at a time, so long
+        multi-year streams can be consumed without materializing them. Results
+        are not stored on the processor.
+        
+        Args:
+            crypto_data: CryptoPriceData objects sorted by date
+            moon_data: MoonPhaseData objects sorted by date
+            chunk_days: Number of days per processing window
+            
+        Yields:
+            CombinedDataPoint objects with matching dates, in date order
+        """
+        if chunk_days <= 0:
+            raise ValueError("chunk_days must be positive")
+        
+        def window(item: Tuple[int, object]) -> int:
+            return item[0] // chunk_days
+        
+        # Key every point by its integer day ordinal once, without allocating date objects
+        crypto_chunks = groupby(
+            ((point.date.toordinal(), point) for point in crypto_data if point and point.date), key=window
+        )
+        moon_chunks = groupby(
+            ((point.date.toordinal(), point) for point in moon_data if point and point.date), key=window
+        )
+        
+        miss_count = 0
+        moon_key, moon_group = next(moon_chunks, (None, None))
+        for crypto_key, crypto_group in crypto_chunks:
+            # Advance the moon stream to the current window
+            while moon_key is not None and moon_key < crypto_key:
+                moon_key, moon_group = next(moon_chunks, (None, None))
+            
+            crypto_items = list(crypto_group)
+            if moon_key != crypto_key:
+                miss_count += len(crypto_items)
+                continue
+            
+            joined = self._join_chunk(crypto_items, list(moon_group))
+            miss_count += len(crypto_items) - len(joined)
+            yield from joined
+            moon_key, moon_group = next(moon_chunks, (None, None))
+        
+        if miss_count:
+            logger.debug("No moon data found for %d cryptocurrency dates", miss_count)
+    
+    def _join_chunk(self, crypto_items: List[Tuple[int, CryptoPriceData]],
+                    moon_items: List[Tuple[int, MoonPhaseData]]) -> List[CombinedDataPoint]:
+        """
+        Join one window of date-ordered crypto and moon points on calendar date.
+        
+        Args:
+            crypto_items: (day ordinal, CryptoPriceData) pairs sorted by date
+            moon_items: (day ordinal, MoonPhaseData) pairs sorted by date
+            
+        Returns:
+            List of CombinedDataPoint objects with matching dates
+        """
+        crypto_days = np.fromiter((day for day, _ in crypto_items), dtype=np.int64, count=len(crypto_items))
+        moon_days = np.fromiter((day for day, _ in moon_items), dtype=np.int64, count=len(moon_items))
+        
+        return self._join_sorted(
+            [point for _, point in crypto_items], crypto_days,
+            [point for _, point in moon_items], moon_days
+        )
+    
+    @staticmethod
+    def _join_sorted(crypto_points: List[CryptoPriceData], crypto_days: np.ndarray,
+                     moon_points: List[MoonPhaseData], moon_days: np.ndarray) -> List[CombinedDataPoint]:
+        """
+        Join crypto and moon points on their day ordinal keys.
+        
+        Args:
+            crypto_points: CryptoPriceData objects in output order
+            crypto_days: Day ordinal of each crypto point
+            moon_points: MoonPhaseData objects sorted by date
+            moon_days: Sorted day ordinal of each moon point
+            
+        Returns:
+            List of CombinedDataPoint objects with matching dates, in crypto order
+        """
+        # One binary search of every crypto day in the moon keys; the last moon point per date wins
+        crypto_idx, moon_idx = match_days(crypto_days, moon_days)
+        
+        return [
+            CombinedDataPoint(
+                date=crypto_points[i].date,
+                crypto_data=crypto_points[i],
+                moon_data=moon_points[j]
+            )
+            for i, j in zip(crypto_idx.tolist(), moon_idx.tolist())
+        ]
+    
     def calculate_price_changes(self, combined_data: Optional[List[CombinedDataPoint]] = None) -> List[CombinedDataPoint]:
         """
         Calculate day-over-day price changes using the formula: 
@@ -122,36 +263,30 @@ class DataProcessor:
             logger.warning("No combined data available for price change calculation")
             return []
         
-        # Sort by date to ensure proper order
-        sorted_data = sorted(data_to_process, key=lambda x: x.date)
+        # Sort by date to ensure proper order; stored data is already sorted when flagged
+        if data_to_process is self._combined_data and self._dates_sorted:
+            sorted_data = data_to_process
+        else:
+            sorted_data = sorted(data_to_process, key=attrgetter('date'))
         
-        # Calculate price changes
-        processed_data = []
-        previous_price = None
+        # Drop points without price data so each change compares consecutive valid prices
+        processed_data = [data_point for data_point in sorted_data if data_point.crypto_data]
         
-        for i, data_point in enumerate(sorted_data):
-            if not data_point.crypto_data:
-                logger.warning(f"Skipping data point with missing cryptocurrency data: {data_point.date}")
-                continue
-            
-            current_price = data_point.crypto_data.close_price
-            
-            if previous_price is not None and previous_price != 0:
-                # Calculate day-over-day percentage change
-                price_change = ((current_price - previous_price) / previous_price) * 100
-                data_point.price_change = price_change
-            else:
-                # First data point or previous price is zero
-                data_point.price_change = None
-            
-            processed_data.append(data_point)
-            previous_price = current_price
-        
-        logger.info(f"Calculated price changes for {len(processed_data)} data points")
+        skipped_count = len(sorted_data) - len(processed_data)
+        if skipped_count:
+            logger.warning(f"Skipping {skipped_count} data points with missing cryptocurrency data")
         
-        # Update stored data
+        # Update stored data and compute changes over the columnar price array
         self._combined_data = processed_data
-        self._update_cache(processed_data)
+        self._update_cache(processed_data, reuse_unchanged=True)
+        
+        price_changes = self._calculate_percent_changes(self._close_prices)
+        self._price_change = price_changes
+        for data_point, price_change in zip(processed_data, price_changes.tolist()):
+            # First data point or previous price is zero
+            data_point.price_change = None if math.isnan(price_change) else price_change
+        
+        logger.info(f"Calculated price changes for {len(processed_data)} data points")
         
         return processed_data
     
@@ -173,10 +308,16 @@ class DataProcessor:
         if start_date > end_date:
             raise ValueError("Start date must be before or equal to end date")
         
-        filtered_data = [
-            data_point for data_point in self._combined_data
-            if start_date <= data_point.date <= end_date
-        ]
+        if self._dates_sorted:
+            # Binary search the sorted dates and slice instead of scanning every point
+            lo = bisect.bisect_left(self._sorted_dates, start_date)
+            hi = bisect.bisect_right(self._sorted_dates, end_date)
+            filtered_data = self._combined_data[lo:hi]
+        else:
+            filtered_data = [
+                data_point for data_point in self._combined_data
+                if start_date <= data_point.date <= end_date
+            ]
         
         logger.info(f"Retrieved {len(filtered_data)} data points for date range "
                    f"{start_date.date()} to {end_date.date()}")
@@ -193,12 +334,14 @@ class DataProcessor:
         Returns:
             CombinedDataPoint for the date, or None if not found
         """
-        return self._data_cache.get(target_date)
+        return self._data_cache.get(target_date.toordinal())
     
     def store_data(self, combined_data: List[CombinedDataPoint]) -> None:
         """
         Store combined data points for later retrieval.
         
+        The list is stored by reference and must not be mutated by the caller afterwards.
+        
         Args:
             combined_data: List of CombinedDataPoint objects to store
         """
@@ -206,56 +349,180 @@ class DataProcessor:
             logger.warning("No data provided for storage")
             return
         
-        self._combined_data = combined_data.copy()
+        self._combined_data = combined_data
         self._update_cache(combined_data)
         
         logger.info(f"Stored {len(combined_data)} combined data points")
     
-    def retrieve_all_data(self) -> List[CombinedDataPoint]:
+    def retrieve_all_data(self) -> Tuple[CombinedDataPoint, ...]:
         """
         Retrieve all stored combined data points.
         
+        The snapshot is built once per data version, so repeated reads of
+        unchanged data return the same tuple without copying.
+        
         Returns:
-            List of all stored CombinedDataPoint objects
+            Immutable tuple of all stored CombinedDataPoint objects
         """
-        return self._combined_data.copy()
+        if self._snapshot_version != self._data_version:
+            self._snapshot = tuple(self._combined_data)
+            self._snapshot_version = self._data_version
+        return self._snapshot
+    
+    def get_soa_view(self) -> SoAView:
+        """
+        Get columnar arrays over the stored data points.
+        
+        The arrays are shared with the processor rather than copied, so callers
+        must treat them as read-only.
+        
+        Returns:
+            SoAView with arrays aligned to the stored points
+        """
+        return SoAView(
+            dates=self._dates,
+            close=self._close_prices,
+            volume=self._volumes,
+            price_change=self._price_change,
+            is_full_moon=self._is_full_moon,
+            phase_pct=self._phase_pct
+        )
     
     def clear_data(self) -> None:
         """Clear all stored data."""
-        self._combined_data.clear()
+        self._combined_data = []
+        self._data_version += 1
         self._data_cache.clear()
+        self._close_prices = np.empty(0, dtype=np.float64)
+        self._dates = np.empty(0, dtype='datetime64[D]')
+        self._price_change = np.empty(0, dtype=np.float64)
+        self._is_full_moon = np.empty(0, dtype=bool)
+        self._volumes = np.empty(0, dtype=np.float64)
+        self._phase_pct = np.empty(0, dtype=np.float64)
+        self._sorted_dates = []
+        self._dates_sorted = True
+        self._cached_points = []
+        self._cache_fingerprint = None
         logger.info("Cleared all stored data")
     
-    def get_data_summary(self) -> Dict[str, int]:
+    def get_data_summary(self) -> Dict[str, Any]:
         """
         Get summary statistics about stored data.
         
         Returns:
-            Dictionary with summary statistics
+            Dictionary with summary statistics, including price change stats of
+            full moon days (average is NaN when none has a price change)
         """
-        total_points = len(self._combined_data)
-        points_with_price_change = sum(1 for point in self._combined_data if point.price_change is not None)
-        full_moon_points = sum(1 for point in self._combined_data if point.moon_data.is_full_moon)
+        (total_points, full_moon_points, points_with_price_change, full_moon_with_change,
+         full_moon_avg_change, full_moon_positive, full_moon_negative) = summarize(
+            self._is_full_moon, self._price_change
+        )
         
         return {
-            'total_points': total_points,
-            'points_with_price_change': points_with_price_change,
-            'full_moon_points': full_moon_points,
-            'normal_day_points': total_points - full_moon_points
+            'total_points': int(total_points),
+            'points_with_price_change': int(points_with_price_change),
+            'full_moon_points': int(full_moon_points),
+            'normal_day_points': int(total_points - full_moon_points),
+            'full_moon_with_change': int(full_moon_with_change),
+            'full_moon_avg_change': float(full_moon_avg_change),
+            'full_moon_positive': int(full_moon_positive),
+            'full_moon_negative': int(full_moon_negative)
         }
     
-    def _update_cache(self, combined_data: List[CombinedDataPoint]) -> None:
+    @staticmethod
+    def _calculate_percent_changes(prices: np.ndarray) -> np.ndarray:
+        """
+        Calculate day-over-day percentage changes for a price array.
+        
+        Args:
+            prices: Array of closing prices ordered by date
+            
+        Returns:
+            Array of percentage changes, NaN where no previous non-zero price exists
+        """
+        changes = np.full(prices.shape, np.nan)
+        if prices.size > 1:
+            previous = prices[:-1]
+            current = prices[1:]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                changes[1:] = np.where(previous != 0, ((current - previous) / previous) * 100, np.nan)
+        return changes
+    
+    @staticmethod
+    def _fingerprint(combined_data: List[CombinedDataPoint]) -> Optional[Tuple]:
+        """
+        Build a cheap fingerprint of a data point list for cache invalidation.
+        
+        Args:
+            combined_data: List of CombinedDataPoint objects
+            
+        Returns:
+            Tuple of length and boundary point identities/dates, or None if empty
+        """
+        if not combined_data:
+            return None
+        first, last = combined_data[0], combined_data[-1]
+        return (len(combined_data), id(first), id(last),
+                getattr(first, 'date', None), getattr(last, 'date', None))
+    
+    def _update_cache(self, combined_data: List[CombinedDataPoint], reuse_unchanged: bool = False) -> None:
         """
         Update the internal cache with combined data points.
         
         Args:
             combined_data: List of CombinedDataPoint objects
+            reuse_unchanged: Keep the existing cache when it already indexes these
+                exact point objects. Only safe for callers that refresh any mutated
+                columns themselves, since point contents are not compared.
         """
+        # Skip the rebuild when the cache already indexes these exact points,
+        # e.g. in calculate_price_changes which only mutates price_change
+        fingerprint = self._fingerprint(combined_data)
+        if (reuse_unchanged and fingerprint == self._cache_fingerprint and
+                all(new is old for new, old in zip(combined_data, self._cached_points))):
+            return
+        
+        self._cached_points = combined_data
+        self._cache_fingerprint = fingerprint
+        self._data_version += 1
+        
         self._data_cache.clear()
         for data_point in combined_data:
             if data_point and data_point.date:
-                date_key = data_point.date.date()
-                self._data_cache[date_key] = data_point
+                self._data_cache[data_point.date.toordinal()] = data_point
+        
+        self._sorted_dates = [data_point.date if data_point else None for data_point in combined_data]
+        self._dates_sorted = None not in self._sorted_dates and all(
+            previous <= current for previous, current in zip(self._sorted_dates, self._sorted_dates[1:])
+        )
+        
+        # Fill the columnar arrays straight from generators, without intermediate lists
+        count = len(combined_data)
+        # Epoch day numbers reinterpreted as datetime64[D], avoiding per-object datetime parsing
+        self._dates = np.fromiter((
+            data_point.date.toordinal() - _EPOCH_ORDINAL if data_point and data_point.date else _NAT
+            for data_point in combined_data
+        ), dtype=np.int64, count=count).view('datetime64[D]')
+        self._close_prices = np.fromiter((
+            data_point.crypto_data.close_price if data_point and data_point.crypto_data else np.nan
+            for data_point in combined_data
+        ), dtype=np.float64, count=count)
+        self._price_change = np.fromiter((
+            data_point.price_change if data_point and data_point.price_change is not None else np.nan
+            for data_point in combined_data
+        ), dtype=np.float64, count=count)
+        self._is_full_moon = np.fromiter((
+            bool(data_point and data_point.moon_data and data_point.moon_data.is_full_moon)
+            for data_point in combined_data
+        ), dtype=bool, count=count)
+        self._volumes = np.fromiter((
+            data_point.crypto_data.volume if data_point and data_point.crypto_data else np.nan
+            for data_point in combined_data
+        ), dtype=np.float64, count=count)
+        self._phase_pct = np.fromiter((
+            data_point.moon_data.phase_percentage if data_point and data_point.moon_data else np.nan
+            for data_point in combined_data
+        ), dtype=np.float64, count=count)
     
     def validate_combined_data(self, combined_data: List[CombinedDataPoint]) -> Tuple[bool, List[str]]:
         """
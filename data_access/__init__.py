@@ -3,10 +3,12 @@
 
 from .bitcoin_client import BitcoinDataClient, BitcoinPriceData
 from .moon_calculator import MoonPhaseCalculator, MoonPhaseData
+from .price_cache import PriceHistoryStore
 
 __all__ = [
     'BitcoinDataClient',
     'BitcoinPriceData', 
     'MoonPhaseCalculator',
-    'MoonPhaseData'
+    'MoonPhaseData',
+    'PriceHistoryStore'
 ]
\ No newline at end of file
@@ -4,18 +4,29 @@ Handles fetching crypto data (BTC, ETH, SOL) with proper error handling and rate
 """
 
 import requests
+import threading
 import time
 from datetime import datetime
+from pathlib import Path
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 import logging
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CryptoPriceData:
     """Data model for cryptocurrency price information."""
     date: datetime
@@ -42,6 +53,10 @@ class CryptoDataClient:
     
     BASE_URL = "https://api.bybit.com"
     RATE_LIMIT_DELAY = 0.1  # 100ms between requests
+    DISK_CACHE_TTL = 3600  # Seconds a cached response is served; today's candle keeps moving
+    CONNECTION_POOL_SIZE = 8
+    REQUEST_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+    RETRY_STATUS_CODES = (429, 502, 503, 504)
     
     # Supported cryptocurrencies
     SUPPORTED_CRYPTOS = {
@@ -50,20 +65,48 @@ class CryptoDataClient:
         'Solana': 'SOLUSDT'
     }
     
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[Path] = None, use_disk_cache: bool = True):
+        """
+        Initialize the client.
+        
+        Args:
+            cache_dir: Directory for the on-disk price cache. Defaults to ~/.cache/cryptomoon
+            use_disk_cache: Whether to serve and persist responses through the disk cache
+        """
         self.session = requests.Session()
         self.session.headers.update({
+            'Accept': 'application/json',
             'User-Agent': 'CryptoMoonDashboard/1.0'
         })
+        # Retry throttled and transient gateway errors with exponential backoff
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=self.RETRY_STATUS_CODES,
+            allowed_methods=('GET',)
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.CONNECTION_POOL_SIZE,
+            pool_maxsize=self.CONNECTION_POOL_SIZE,
+            max_retries=retry
+        )
+        self.session.mount('https://', adapter)
         self.last_request_time = 0
+        self._rate_limit_lock = threading.Lock()
+        
+        # Imported here because price_cache depends on CryptoPriceData from this module
+        from data_access.price_cache import PriceHistoryStore
+        self.price_store = PriceHistoryStore(cache_dir) if use_disk_cache else None
     
     def _rate_limit(self):
         """Implement rate limiting between API requests."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.RATE_LIMIT_DELAY:
-            time.sleep(self.RATE_LIMIT_DELAY - time_since_last)
-        self.last_request_time = time.time()
+        # Serialize request starts so parallel fetches still respect the delay
+        with self._rate_limit_lock:
+            current_time = time.time()
+            time_since_last = current_time - self.last_request_time
+            if time_since_last < self.RATE_LIMIT_DELAY:
+                time.sleep(self.RATE_LIMIT_DELAY - time_since_last)
+            self.last_request_time = time.time()
     
     def _make_request(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Make a rate-limited request to the Bybit API."""
@@ -72,10 +115,11 @@ class CryptoDataClient:
         url = f"{self.BASE_URL}{endpoint}"
         
         try:
-            response = self.session.get(url, params=params, timeout=30)
+            response = self.session.get(url, params=params, timeout=self.REQUEST_TIMEOUT)
             response.raise_for_status()
             
-            data = response.json()
+            # orjson parses the raw bytes directly, skipping the text decode and stdlib parser
+            data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
             
             # Check for API-level errors
             if data.get('retCode') != 0:
@@ -96,6 +140,9 @@ class CryptoDataClient:
         except requests.exceptions.RequestException as e:
             logger.error(f"Request error when fetching Bitcoin data: {e}")
             raise
+        except ValueError as e:
+            logger.error(f"Invalid JSON response when fetching Bitcoin data: {e}")
+            raise requests.RequestException(f"Invalid JSON response: {e}") from e
     
     def fetch_crypto_data(self, crypto_name: str = 'Bitcoin', limit: int = 1000) -> List[CryptoPriceData]:
         """
@@ -120,6 +167,13 @@ class CryptoDataClient:
         
         symbol = self.SUPPORTED_CRYPTOS[crypto_name]
         
+        # Serve a recent response from disk before going to the network
+        cache_key = self._cache_key(symbol, limit)
+        cached_data = self.price_store.load(cache_key) if self.price_store is not None else []
+        if cached_data and self.price_store.is_fresh(cache_key, self.DISK_CACHE_TTL):
+            logger.info(f"Loaded {len(cached_data)} cached data points for {symbol}")
+            return cached_data
+        
         endpoint = "/v5/market/kline"
         params = {
             'category': 'linear',
@@ -128,7 +182,15 @@ class CryptoDataClient:
             'limit': limit
         }
         
-        logger.info(f"Fetching {limit} days of {symbol} data from Bybit")
+        # With a stale cache only candles from the last cached day onwards are requested;
+        # that day is fetched again because its candle was still forming when cached
+        delta_start = cached_data[-1].date if cached_data else None
+        if delta_start is not None and (datetime.now() - delta_start).days < limit:
+            params['start'] = int(delta_start.timestamp() * 1000)
+            logger.info(f"Fetching {symbol} data since {delta_start:%Y-%m-%d} from Bybit")
+        else:
+            delta_start = None
+            logger.info(f"Fetching {limit} days of {symbol} data from Bybit")
         
         try:
             data = self._make_request(endpoint, params)
@@ -138,7 +200,7 @@ class CryptoDataClient:
             
             if not klines:
                 logger.warning(f"No kline data received from API for {symbol}")
-                return []
+                return cached_data if delta_start is not None else []
             
             # Parse and validate data
             crypto_data = []
@@ -157,12 +219,33 @@ class CryptoDataClient:
             crypto_data.sort(key=lambda x: x.date)
             
             logger.info(f"Successfully fetched and parsed {len(crypto_data)} data points for {symbol}")
+            
+            if delta_start is not None and not crypto_data:
+                logger.warning(f"No valid new candles for {symbol}; serving cached data")
+                return cached_data
+            
+            # Newly fetched candles replace cached ones from the same day onwards
+            if delta_start is not None:
+                first_new_date = crypto_data[0].date
+                crypto_data = [point for point in cached_data if point.date < first_new_date] + crypto_data
+                crypto_data = crypto_data[-limit:]
+            
+            if self.price_store is not None and crypto_data:
+                try:
+                    self.price_store.save(cache_key, crypto_data)
+                except Exception as e:
+                    logger.warning(f"Failed to cache {symbol} data on disk: {e}")
+            
             return crypto_data
             
         except Exception as e:
             logger.error(f"Failed to fetch {crypto_name} data: {e}")
             raise
     
+    def _cache_key(self, symbol: str, limit: int) -> str:
+        """Build the disk cache key for a symbol and limit."""
+        return f"{symbol}_{limit}"
+    
     def fetch_btcusdt_data(self, limit: int = 1000) -> List[CryptoPriceData]:
         """
         Backward compatibility method for fetching Bitcoin data.
@@ -5,7 +5,7 @@ Implements moon phase calculation for given dates with normalization to 0-100% s
 
 import math
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 from dataclasses import dataclass
 import logging
 
@@ -13,7 +13,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class MoonPhaseData:
     """Data model for moon phase information."""
     date: datetime
@@ -34,7 +34,8 @@ class MoonPhaseCalculator:
     
     def __init__(self):
         """Initialize the moon phase calculator."""
-        pass
+        # Phases are a pure function of the date, so results are memoized per year
+        self._phase_cache: Dict[int, Dict[datetime, MoonPhaseData]] = {}
     
     def calculate_moon_phase(self, date: datetime) -> Optional[MoonPhaseData]:
         """
@@ -102,7 +103,13 @@ class MoonPhaseCalculator:
         
         for date in dates:
             try:
-                phase_data = self.calculate_moon_phase(date)
+                year_cache = self._phase_cache.setdefault(date.year, {})
+                phase_data = year_cache.get(date)
+                if phase_data is None:
+                    phase_data = self.calculate_moon_phase(date)
+                    if phase_data is not None:
+                        year_cache[date] = phase_data
+                
                 if phase_data is not None:
                     moon_phases.append(phase_data)
                 else:
@@ -118,6 +125,10 @@ class MoonPhaseCalculator:
         logger.info(f"Successfully calculated moon phases for {len(moon_phases)} dates")
         return moon_phases
     
+    def clear_cache(self) -> None:
+        """Clear memoized moon phase results."""
+        self._phase_cache.clear()
+    
     def find_full_moon_dates(self, moon_phases: list[MoonPhaseData]) -> list[MoonPhaseData]:
         """
         Identify dates with full moon phases (>98% illumination).
@@ -0,0 +1,158 @@
+"""
+Price History Store for on-disk caching of OHLCV data.
+Persists cryptocurrency price history as compressed Parquet files.
+"""
+
+from pathlib import Path
+from typing import List, Optional
+import logging
+import os
+import tempfile
+import time
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from data_access.bitcoin_client import CryptoPriceData
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class PriceHistoryStore:
+    """Parquet-backed store for cached OHLCV price history."""
+    
+    DEFAULT_CACHE_DIR = Path.home() / ".cache" / "cryptomoon"
+    
+    # Column layout of the cached files
+    SCHEMA = pa.schema([
+        pa.field('ts', pa.timestamp('ms')),
+        pa.field('open', pa.float64()),
+        pa.field('high', pa.float64()),
+        pa.field('low', pa.float64()),
+        pa.field('close', pa.float64()),
+        pa.field('volume', pa.float64()),
+        pa.field('symbol', pa.string())
+    ])
+    
+    # Timestamps are evenly spaced, so delta encoding packs them into a few bits each.
+    # Byte-stream-split groups the IEEE 754 exponent bytes of slowly varying prices
+    # together, which lets zstd approach the ratio of a dedicated XOR float codec.
+    COLUMN_ENCODING = {
+        'ts': 'DELTA_BINARY_PACKED',
+        'open': 'BYTE_STREAM_SPLIT',
+        'high': 'BYTE_STREAM_SPLIT',
+        'low': 'BYTE_STREAM_SPLIT',
+        'close': 'BYTE_STREAM_SPLIT',
+        'volume': 'BYTE_STREAM_SPLIT'
+    }
+    
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Initialize the price history store.
+        
+        Args:
+            cache_dir: Directory for cached files. Defaults to ~/.cache/cryptomoon
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else self.DEFAULT_CACHE_DIR
+    
+    def path_for(self, key: str) -> Path:
+        """Get the file path used for a cache key."""
+        return self.cache_dir / f"{key}.parquet"
+    
+    def save(self, key: str, data: List[CryptoPriceData]) -> Path:
+        """
+        Write price history to the cache.
+        
+        Args:
+            key: Cache key identifying the dataset
+            data: List of CryptoPriceData objects to persist
+        
+        Returns:
+            Path of the written file
+        """
+        table = pa.table({
+            'ts': [point.date for point in data],
+            'open': [point.open_price for point in data],
+            'high': [point.high_price for point in data],
+            'low': [point.low_price for point in data],
+            'close': [point.close_price for point in data],
+            'volume': [point.volume for point in data],
+            'symbol': [point.symbol for point in data]
+        }, schema=self.SCHEMA)
+        
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Write to a private temporary file and swap it in, so readers never see a partial file
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix='.tmp')
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        try:
+            pq.write_table(
+                table,
+                tmp_path,
+                compression='zstd',
+                use_dictionary=['symbol'],
+                column_encoding=self.COLUMN_ENCODING
+            )
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        
+        logger.info(f"Cached {len(data)} price data points to {path}")
+        return path
+    
+    def is_fresh(self, key: str, max_age: float) -> bool:
+        """
+        Check whether a cached file exists and is younger than max_age.
+        
+        Args:
+            key: Cache key identifying the dataset
+            max_age: Maximum file age in seconds
+        
+        Returns:
+            True if the file was written within max_age seconds
+        """
+        try:
+            return self.path_for(key).stat().st_mtime >= time.time() - max_age
+        except OSError:
+            return False
+    
+    def load(self, key: str) -> List[CryptoPriceData]:
+        """
+        Read price history from the cache.
+        
+        Freshness is not checked here; use is_fresh to decide whether to refetch.
+        
+        Args:
+            key: Cache key identifying the dataset
+        
+        Returns:
+            List of CryptoPriceData objects, or empty list if not cached
+        """
+        path = self.path_for(key)
+        if not path.exists():
+            return []
+        
+        try:
+            columns = pq.read_table(path).to_pydict()
+        except (OSError, pa.ArrowException) as e:
+            logger.warning(f"Failed to read cached price data from {path}: {e}")
+            return []
+        
+        return [
+            CryptoPriceData(
+                date=ts,
+                open_price=open_price,
+                high_price=high_price,
+                low_price=low_price,
+                close_price=close_price,
+                volume=volume,
+                symbol=symbol
+            )
+            for ts, open_price, high_price, low_price, close_price, volume, symbol in zip(
+                columns['ts'], columns['open'], columns['high'], columns['low'],
+                columns['close'], columns['volume'], columns['symbol']
+            )
+        ]
@@ -9,14 +9,17 @@ from data access, business logic, and presentation layers.
 import logging
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add project root to path for imports
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from presentation.dashboard_ui import DashboardUI
 from config import get_config, get_component_configs
 
+if TYPE_CHECKING:
+    from presentation.dashboard_ui import DashboardUI
+
 # Get application configuration
 app_config = get_config()
 
@@ -31,6 +34,15 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Dashboard attributes that must be wired for the application to run
+REQUIRED_COMPONENTS = (
+    'crypto_client',
+    'moon_calculator',
+    'data_processor',
+    'correlation_analyzer',
+    'chart_renderer'
+)
+
 
 def configure_application():
     """Configure application settings and environment."""
@@ -41,10 +53,11 @@ def configure_application():
         logger.info(f"Log level: {app_config.log_level}")
         
         # Log component configurations
-        component_configs = get_component_configs()
-        logger.info("Component configurations:")
-        for component, config in component_configs.items():
-            logger.info(f"  {component}: {config}")
+        if logger.isEnabledFor(logging.INFO):
+            component_configs = get_component_configs()
+            logger.info("Component configurations:")
+            for component, config in component_configs.items():
+                logger.info(f"  {component}: {config}")
         
         logger.info("Initializing data access layer (Crypto API client, Moon calculator)")
         logger.info("Initializing business logic layer (Data processor, Correlation analyzer)")
@@ -56,7 +69,7 @@ def configure_application():
         return False
 
 
-def verify_component_integration(dashboard: DashboardUI) -> bool:
+def verify_component_integration(dashboard: "DashboardUI") -> bool:
     """
     Verify that all components are properly wired and accessible.
     
@@ -67,27 +80,10 @@ def verify_component_integration(dashboard: DashboardUI) -> bool:
         True if all components are properly integrated, False otherwise
     """
     try:
-        # Verify data access layer components
-        if not hasattr(dashboard, 'crypto_client') or dashboard.crypto_client is None:
-            logger.error("CryptoDataClient not properly wired")
-            return False
-        
-        if not hasattr(dashboard, 'moon_calculator') or dashboard.moon_calculator is None:
-            logger.error("MoonPhaseCalculator not properly wired")
-            return False
-        
-        # Verify business logic layer components
-        if not hasattr(dashboard, 'data_processor') or dashboard.data_processor is None:
-            logger.error("DataProcessor not properly wired")
-            return False
-        
-        if not hasattr(dashboard, 'correlation_analyzer') or dashboard.correlation_analyzer is None:
-            logger.error("CorrelationAnalyzer not properly wired")
-            return False
-        
-        # Verify presentation layer components
-        if not hasattr(dashboard, 'chart_renderer') or dashboard.chart_renderer is None:
-            logger.error("ChartRenderer not properly wired")
+        # Data access, business logic and presentation layer components
+        missing = [name for name in REQUIRED_COMPONENTS if getattr(dashboard, name, None) is None]
+        if missing:
+            logger.error(f"Components not properly wired: {', '.join(missing)}")
             return False
         
         logger.info("All components verified and properly integrated")
@@ -98,7 +94,7 @@ def verify_component_integration(dashboard: DashboardUI) -> bool:
         return False
 
 
-def create_application() -> DashboardUI:
+def create_application() -> "DashboardUI":
     """
     Application factory function that creates and wires all components.
     
@@ -113,6 +109,9 @@ def create_application() -> DashboardUI:
     try:
         logger.info("Creating application components...")
         
+        # Imported here so Streamlit, Plotly and pandas load only when the UI is built
+        from presentation.dashboard_ui import DashboardUI
+        
         # The DashboardUI constructor automatically creates and wires:
         # - CryptoDataClient for fetching crypto data (BTC, ETH, SOL) from Bybit API
         # - MoonPhaseCalculator for astronomical moon phase calculations
@@ -2,6 +2,14 @@
 # This module handles UI components, charts, and dashboard interface
 
 from .dashboard_ui import DashboardUI
-from .chart_renderer import ChartRenderer
+
+
+def __getattr__(name):
+    # ChartRenderer pulls in Plotly, so it is imported on first access
+    if name == 'ChartRenderer':
+        from .chart_renderer import ChartRenderer
+        return ChartRenderer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ['DashboardUI', 'ChartRenderer']
\ No newline at end of file
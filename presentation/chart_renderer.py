@@ -10,6 +10,8 @@ from datetime import datetime
 from typing import List, Optional, Dict, Any
 import logging
 
+import numpy as np
+
 from business_logic.data_processor import CombinedDataPoint
 
 # Configure logging
@@ -36,6 +38,9 @@ class ChartRenderer:
         'modeBarButtonsToRemove': ['pan2d', 'select2d', 'lasso2d', 'autoScale2d']
     }
     
+    # Longer price histories are downsampled before plotting to keep hover and zoom responsive
+    MAX_LINE_POINTS = 1000
+    
     def __init__(self):
         """Initialize the chart renderer."""
         self.theme = self.DARK_THEME.copy()
@@ -70,6 +75,16 @@ class ChartRenderer:
         dates = [point.date for point in valid_data]
         prices = [point.crypto_data.close_price for point in valid_data]
         
+        if len(valid_data) > self.MAX_LINE_POINTS:
+            keep = self._downsample_lttb(
+                np.array(dates, dtype='datetime64[s]').astype(np.float64),
+                np.array(prices, dtype=np.float64),
+                self.MAX_LINE_POINTS
+            )
+            dates = [dates[i] for i in keep]
+            prices = [prices[i] for i in keep]
+            logger.info(f"Downsampled price line from {len(valid_data)} to {len(keep)} points")
+        
         # Get crypto symbol for display
         crypto_symbol = valid_data[0].crypto_data.symbol if valid_data else "CRYPTO"
         
@@ -185,6 +200,50 @@ class ChartRenderer:
         """Backward compatibility method."""
         return self.create_crypto_price_chart(combined_data, title)
     
+    @staticmethod
+    def _downsample_lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+        """
+        Select points with Largest-Triangle-Three-Buckets downsampling.
+        
+        Keeps the first and last points and, from each bucket in between, the point
+        forming the largest triangle with the previously kept point and the average
+        of the next bucket, which preserves the visual shape of the line.
+        
+        Args:
+            x: Ascending x values as floats
+            y: y values aligned with x
+            threshold: Number of points to keep
+            
+        Returns:
+            Ascending indices of the kept points
+        """
+        n = len(x)
+        if threshold >= n or threshold < 3:
+            return np.arange(n)
+        
+        # threshold - 2 buckets cover every point except the first and last
+        edges = np.linspace(1, n - 1, threshold - 1).astype(np.intp)
+        keep = np.empty(threshold, dtype=np.intp)
+        keep[0] = 0
+        keep[-1] = n - 1
+        
+        previous = 0
+        for bucket in range(threshold - 2):
+            start, end = edges[bucket], edges[bucket + 1]
+            next_start = end
+            next_end = edges[bucket + 2] if bucket + 2 < len(edges) else n
+            avg_x = x[next_start:next_end].mean()
+            avg_y = y[next_start:next_end].mean()
+            
+            areas = np.abs(
+                (x[previous] - avg_x) * (y[start:end] - y[previous]) -
+                (x[previous] - x[start:end]) * (avg_y - y[previous])
+            )
+            previous = start + int(np.argmax(areas))
+            keep[bucket + 1] = previous
+        
+        return keep
+    
     def _validate_data_point(self, point: CombinedDataPoint) -> bool:
         """
         Validate that a data point has all required fields for charting.
@@ -4,33 +4,548 @@ Implements main dashboard interface with dark theme, refresh functionality, and
 """
 
 import streamlit as st
+import hashlib
 import logging
-from typing import Optional, Dict, Any
+import math
+import re
+import time
+import numpy as np
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple
 from datetime import datetime
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
 
-from data_access.bitcoin_client import CryptoDataClient
-from data_access.moon_calculator import MoonPhaseCalculator
-from business_logic.data_processor import DataProcessor
-from business_logic.correlation_analyzer import CorrelationAnalyzer
-from presentation.chart_renderer import ChartRenderer
+from data_access.bitcoin_client import CryptoDataClient, CryptoPriceData
+from data_access.moon_calculator import MoonPhaseCalculator, MoonPhaseData
+from business_logic.data_processor import DataProcessor, SoAView
+from business_logic.correlation_analyzer import CorrelationAnalyzer, AnalysisResults
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from presentation.chart_renderer import ChartRenderer
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Static dark theme stylesheet, minified once at import
+_RAW_DARK_THEME_CSS = """
+<style>
+/* Main app background with dark gradient */
+.stApp {
+    background: linear-gradient(135deg, #0f0f23 0%, #1a1a2e 50%, #16213e 100%);
+    color: #e8e8e8;
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+}
+
+/* Override Streamlit's default styles */
+.stApp > div {
+    background: transparent;
+}
+
+/* Main header with crypto-themed gradient */
+.main-header {
+    text-align: center;
+    padding: 3rem 0;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 50%, #f093fb 100%);
+    border-radius: 20px;
+    margin-bottom: 2rem;
+    box-shadow: 0 10px 30px rgba(102, 126, 234, 0.4);
+    position: relative;
+    overflow: hidden;
+}
+
+.main-header::before {
+    content: '';
+    position: absolute;
+    top: 0;
+    left: 0;
+    right: 0;
+    bottom: 0;
+    background: linear-gradient(45deg, transparent 30%, rgba(255,255,255,0.1) 50%, transparent 70%);
+    animation: shimmer 3s infinite;
+}
+
+@keyframes shimmer {
+    0% { transform: translateX(-100%); }
+    100% { transform: translateX(100%); }
+}
+
+.main-header h1 {
+    color: #ffffff !important;
+    text-shadow: 2px 2px 8px rgba(0,0,0,0.5);
+    font-size: 3rem !important;
+    margin-bottom: 0.5rem !important;
+}
+
+.main-header p {
+    color: rgba(255,255,255,0.9) !important;
+    font-size: 1.2rem !important;
+    text-shadow: 1px 1px 4px rgba(0,0,0,0.3);
+}
+
+/* Enhanced metric containers */
+.metric-container {
+    background: linear-gradient(135deg, #1e2139 0%, #2a2d5a 100%);
+    padding: 2rem;
+    border-radius: 15px;
+    border: 1px solid #3d4465;
+    margin: 1rem 0;
+    box-shadow: 0 8px 25px rgba(0,0,0,0.3);
+    transition: all 0.3s ease;
+    position: relative;
+    overflow: hidden;
+}
+
+.metric-container::before {
+    content: '';
+    position: absolute;
+    top: 0;
+    left: 0;
+    right: 0;
+    height: 3px;
+    background: linear-gradient(90deg, #00d4aa, #667eea, #764ba2);
+}
+
+.metric-container:hover {
+    transform: translateY(-5px);
+    box-shadow: 0 15px 35px rgba(0,0,0,0.4);
+    border-color: #00d4aa;
+}
+
+.metric-title {
+    font-size: 1.3rem;
+    font-weight: bold;
+    color: #00d4aa;
+    margin-bottom: 0.8rem;
+    text-transform: uppercase;
+    letter-spacing: 1px;
+}
+
+.metric-value {
+    font-size: 2.5rem;
+    font-weight: bold;
+    margin-bottom: 0.5rem;
+    text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+}
+
+.metric-subtitle {
+    font-size: 1rem;
+    color: #b8bcc8;
+    opacity: 0.8;
+}
+
+/* Four-column grid of metric cards rendered as one element */
+.metric-grid {
+    display: grid;
+    grid-template-columns: repeat(4, 1fr);
+    gap: 1rem;
+}
+
+.metric-grid .metric-container {
+    margin: 0;
+}
+
+/* Enhanced color scheme for changes */
+.positive-change {
+    color: #00ff88;
+    text-shadow: 0 0 10px rgba(0, 255, 136, 0.3);
+}
+
+.negative-change {
+    color: #ff4757;
+    text-shadow: 0 0 10px rgba(255, 71, 87, 0.3);
+}
+
+.neutral-change {
+    color: #e8e8e8;
+}
+
+/* Enhanced data summary */
+.data-summary {
+    background: linear-gradient(135deg, #1e2139 0%, #2a2d5a 100%);
+    padding: 1.5rem;
+    border-radius: 12px;
+    border-left: 4px solid #00d4aa;
+    margin: 1rem 0;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.2);
+    color: #e8e8e8;
+}
+
+/* Enhanced refresh section */
+.refresh-section {
+    background: linear-gradient(135deg, #1e2139 0%, #2a2d5a 100%);
+    padding: 2rem;
+    border-radius: 15px;
+    margin-bottom: 2rem;
+    text-align: center;
+    box-shadow: 0 8px 25px rgba(0,0,0,0.3);
+    border: 1px solid #3d4465;
+}
+
+.refresh-section h3 {
+    color: #00d4aa !important;
+    margin-bottom: 1rem !important;
+}
+
+/* Enhanced selectbox styling */
+.stSelectbox > div > div {
+    background-color: #2a2d5a !important;
+    border: 1px solid #3d4465 !important;
+    border-radius: 8px !important;
+    color: #e8e8e8 !important;
+}
+
+.stSelectbox > div > div:hover {
+    border-color: #00d4aa !important;
+}
+
+.st-key-crypto_selector {
+    max-width: 24rem;
+    margin: 0 auto;
+}
+
+/* Content-width buttons get a fit-content container, so center the container itself */
+.st-key-refresh_button {
+    margin: 0 auto;
+    align-self: center;
+}
+
+.stSelectbox label {
+    color: #00d4aa !important;
+    font-weight: bold !important;
+}
+
+/* Enhanced dataframe styling */
+.stDataFrame {
+    background-color: #1e2139 !important;
+}
+
+.stDataFrame table {
+    background-color: #2a2d5a !important;
+    color: #e8e8e8 !important;
+}
+
+.stDataFrame th {
+    background-color: #1e2139 !important;
+    color: #00d4aa !important;
+    font-weight: bold !important;
+}
+
+.stDataFrame td {
+    background-color: #2a2d5a !important;
+    color: #e8e8e8 !important;
+}
+
+/* Enhanced button styling */
+.stButton > button {
+    background: linear-gradient(135deg, #00d4aa 0%, #00b894 100%);
+    color: #1a1a2e !important;
+    border: none;
+    border-radius: 12px;
+    padding: 1rem 3rem;
+    font-weight: bold;
+    font-size: 1.1rem;
+    transition: all 0.3s ease;
+    margin: 0 auto;
+    display: block;
+    text-transform: uppercase;
+    letter-spacing: 1px;
+    box-shadow: 0 4px 15px rgba(0, 212, 170, 0.3);
+}
+
+.stButton > button:hover {
+    background: linear-gradient(135deg, #00b894 0%, #009975 100%);
+    transform: translateY(-3px);
+    box-shadow: 0 8px 25px rgba(0, 212, 170, 0.5);
+}
+
+.stButton > button:active {
+    transform: translateY(-1px);
+}
+
+.stButton {
+    display: flex;
+    justify-content: center;
+    width: 100%;
+}
+
+/* Enhanced welcome message */
+.welcome-message {
+    text-align: center;
+    padding: 3rem;
+    background: linear-gradient(135deg, #1e2139 0%, #2a2d5a 100%);
+    border-radius: 20px;
+    margin: 2rem 0;
+    box-shadow: 0 10px 30px rgba(0,0,0,0.3);
+    border: 1px solid #3d4465;
+    color: #e8e8e8;
+}
+
+.welcome-message h2 {
+    color: #00d4aa !important;
+    margin-bottom: 1rem !important;
+}
+
+.welcome-message p {
+    color: #b8bcc8 !important;
+}
+
+/* Text color overrides */
+.stMarkdown, .stText, p, div, span {
+    color: #e8e8e8 !important;
+}
+
+h1, h2, h3, h4, h5, h6 {
+    color: #00d4aa !important;
+}
+
+.stMetric {
+    background: linear-gradient(135deg, #1e2139 0%, #2a2d5a 100%);
+    padding: 1rem;
+    border-radius: 10px;
+    border: 1px solid #3d4465;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.2);
+}
+
+.stMetric > div {
+    color: #e8e8e8 !important;
+}
+
+.stMetric [data-testid="metric-container"] {
+    background-color: transparent;
+    border: none;
+    padding: 0;
+    box-shadow: none;
+}
+
+/* Enhanced error and info messages */
+.stAlert {
+    border-radius: 10px;
+    border: 1px solid #3d4465;
+    box-shadow: 0 4px 16px rgba(0,0,0,0.2);
+    background-color: #2a2d5a;
+    color: #e8e8e8;
+}
+
+.stSuccess {
+    background: linear-gradient(135deg, #1e2139 0%, #2a2d5a 100%);
+    border-left: 4px solid #00ff88;
+    color: #e8e8e8;
+}
+
+.stError {
+    background: linear-gradient(135deg, #1e2139 0%, #2a2d5a 100%);
+    border-left: 4px solid #ff4757;
+    color: #e8e8e8;
+}
+
+.stInfo {
+    background: linear-gradient(135deg, #1e2139 0%, #2a2d5a 100%);
+    border-left: 4px solid #00d4aa;
+    color: #e8e8e8;
+}
+
+.stWarning {
+    background: linear-gradient(135deg, #fffbeb 0%, #fefce8 100%);
+    border-left: 4px solid #f59e0b;
+}
+</style>
+"""
+
+
+def _minify_css(css: str) -> str:
+    """
+    Strip comments and redundant whitespace from a stylesheet.
+    
+    Args:
+        css: Stylesheet source, optionally wrapped in a style tag
+    
+    Returns:
+        Minified stylesheet
+    """
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r'\s*([{};,>])\s*', r'\1', css).strip()
+
+
+_DARK_THEME_CSS = _minify_css(_RAW_DARK_THEME_CSS)
+
+# CSS classes indexed by sign(change) + 1: negative, zero, positive
+_CLASS_LUT = ('negative-change', 'neutral-change', 'positive-change')
+
+# Daily klines loaded per refresh; the speculative moon dates are predicted for the same window
+_KLINE_LIMIT = 1000
+
+_WELCOME_TEMPLATE = """
+<div class="welcome-message">
+    <h2>Welcome to Crypto Moon Dashboard</h2>
+    <p>Select your preferred cryptocurrency above and click "Collect Data" to fetch the latest {crypto} price data and begin analyzing correlations with lunar phases.</p>
+    <p>The dashboard will display:</p>
+    <ul style="text-align: left; display: inline-block;">
+        <li>Interactive {crypto} price chart with full moon indicators</li>
+        <li>Comparative analysis of price changes on full moon vs normal days</li>
+        <li>Statistical insights and data summaries</li>
+    </ul>
+    <p><strong>Supported Cryptocurrencies:</strong> Bitcoin (₿), Ethereum (Ξ), Solana (◎)</p>
+</div>
+"""
+
+# Welcome message per supported cryptocurrency, rendered once at import
+_WELCOME_HTML = {crypto: _WELCOME_TEMPLATE.format(crypto=crypto) for crypto in CryptoDataClient.SUPPORTED_CRYPTOS}
+
+
+@st.cache_resource
+def _get_crypto_client() -> CryptoDataClient:
+    """Get the process-wide cryptocurrency client; it holds an HTTP session, so it is shared rather than copied."""
+    return CryptoDataClient()
+
+
+@st.cache_resource
+def _get_moon_calculator() -> MoonPhaseCalculator:
+    """Get the process-wide moon phase calculator and its per-year phase memo."""
+    return MoonPhaseCalculator()
+
+
+@st.cache_resource
+def _get_clients() -> SimpleNamespace:
+    """
+    Get the stateless dashboard collaborators shared by every session.
+    
+    Returns:
+        Namespace with crypto, moon and analyzer attributes
+    """
+    return SimpleNamespace(
+        crypto=_get_crypto_client(),
+        moon=_get_moon_calculator(),
+        analyzer=CorrelationAnalyzer()
+    )
+
+
+@st.cache_resource
+def _get_chart_renderer() -> "ChartRenderer":
+    """Get the shared chart renderer, importing Plotly only when a chart is first drawn."""
+    from presentation.chart_renderer import ChartRenderer
+    return ChartRenderer()
+
+
+@st.cache_resource
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the process-wide worker pool used to overlap moon calculation with API calls."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="dashboard")
+
+
+def _predict_kline_dates(limit: int) -> Tuple[datetime, ...]:
+    """
+    Predict the dates of the most recent daily klines.
+    
+    Bybit daily klines open at UTC midnight and the client converts their
+    timestamps to local datetimes, so the expected dates are known before
+    the API responds.
+    
+    Args:
+        limit: Number of daily klines requested
+    
+    Returns:
+        Tuple of predicted dates, oldest first
+    """
+    today_start = int(time.time()) // 86400 * 86400
+    return tuple(
+        datetime.fromtimestamp(today_start - day * 86400)
+        for day in range(limit - 1, -1, -1)
+    )
+
+
+@st.cache_data(ttl=3600, max_entries=8, show_spinner=False)
+def _load_crypto(crypto: str, limit: int, bucket: int) -> List[CryptoPriceData]:
+    """
+    Fetch cryptocurrency price data, reusing results within the same hour.
+    
+    Args:
+        crypto: Cryptocurrency name (Bitcoin, Ethereum, Solana)
+        limit: Number of days of data to fetch
+        bucket: Hour bucket, int(time.time() // 3600); a new bucket forces a fresh fetch
+    
+    Returns:
+        List of CryptoPriceData objects
+    """
+    return _get_crypto_client().fetch_crypto_data(crypto, limit=limit)
+
+
+@st.cache_data(ttl=300, max_entries=8, show_spinner=False)
+def _moon_for_dates_cached(dates: Tuple[datetime, ...]) -> List[MoonPhaseData]:
+    """
+    Calculate moon phases for a fixed set of dates, reusing earlier results.
+    
+    Args:
+        dates: Tuple of dates (a tuple so it can be hashed as a cache key)
+    
+    Returns:
+        List of MoonPhaseData objects
+    """
+    return _get_moon_calculator().calculate_moon_phases_for_dates(list(dates))
+
+
+def _hash_soa(view: SoAView) -> bytes:
+    """
+    Fingerprint the columns the correlation analysis depends on.
+    
+    Uses xxh3 when xxhash is installed and falls back to an 8-byte blake2b digest.
+    
+    Args:
+        view: Columnar view of the combined data
+    
+    Returns:
+        Digest of the price change, full moon and missing data arrays
+    """
+    hasher = xxhash.xxh3_64() if XXHASH_AVAILABLE else hashlib.blake2b(digest_size=8)
+    hasher.update(np.ascontiguousarray(view.price_change))
+    hasher.update(np.ascontiguousarray(view.is_full_moon))
+    hasher.update(np.packbits(np.isnan(view.close) | np.isnan(view.phase_pct)))
+    return hasher.digest()
+
+
+@st.cache_data(ttl=300, max_entries=8, show_spinner=False, hash_funcs={SoAView: _hash_soa})
+def _analyze_cached(soa: SoAView) -> AnalysisResults:
+    """
+    Run the correlation analysis, reusing results for identical inputs.
+    
+    The cache key is a single digest of the columnar arrays the analysis depends
+    on, and the analysis itself runs vectorized over the same arrays.
+    
+    Args:
+        soa: Columnar view of the combined data points with price changes
+    
+    Returns:
+        AnalysisResults object
+    """
+    return _get_clients().analyzer.analyze_soa(soa)
+
 
 class DashboardUI:
     """Streamlit-based dashboard interface for Bitcoin Moon analysis."""
     
     def __init__(self):
         """Initialize the dashboard UI components."""
-        self.crypto_client = CryptoDataClient()
-        self.moon_calculator = MoonPhaseCalculator()
-        self.data_processor = DataProcessor()
-        self.correlation_analyzer = CorrelationAnalyzer()
-        self.chart_renderer = ChartRenderer()
+        clients = _get_clients()
+        self.crypto_client = clients.crypto
+        self.moon_calculator = clients.moon
+        self.correlation_analyzer = clients.analyzer
         
         # Initialize session state
         self._initialize_session_state()
+        
+        # DataProcessor keeps the loaded dataset, so each session owns one
+        self.data_processor = st.session_state.data_processor
+    
+    @property
+    def chart_renderer(self) -> "ChartRenderer":
+        """Chart renderer, resolved on first use so the welcome screen never loads Plotly."""
+        return _get_chart_renderer()
     
     def _initialize_session_state(self):
         """Initialize Streamlit session state variables."""
@@ -43,6 +558,9 @@ class DashboardUI:
         if 'analysis_results' not in st.session_state:
             st.session_state.analysis_results = None
         
+        if 'data_summary' not in st.session_state:
+            st.session_state.data_summary = None
+        
         if 'error_message' not in st.session_state:
             st.session_state.error_message = None
         
@@ -51,6 +569,15 @@ class DashboardUI:
         
         if 'selected_crypto' not in st.session_state:
             st.session_state.selected_crypto = 'Bitcoin'
+        
+        if 'soa' not in st.session_state:
+            st.session_state.soa = None
+        
+        if 'data_version' not in st.session_state:
+            st.session_state.data_version = 0
+        
+        if 'data_processor' not in st.session_state:
+            st.session_state.data_processor = DataProcessor()
     
     def render_dashboard(self):
         """Render the complete dashboard interface."""
@@ -83,367 +610,64 @@ class DashboardUI:
     
     def _apply_dark_theme(self):
         """Apply enhanced dark theme styling to the dashboard."""
-        st.markdown("""
-        <style>
-        /* Main app background with dark gradient */
-        .stApp {
-            background: linear-gradient(135deg, #0f0f23 0%, #1a1a2e 50%, #16213e 100%);
-            color: #e8e8e8;
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-        }
-        
-        /* Override Streamlit's default styles */
-        .stApp > div {
-            background: transparent;
-        }
-        
-        /* Main header with crypto-themed gradient */
-        .main-header {
-            text-align: center;
-            padding: 3rem 0;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 50%, #f093fb 100%);
-            border-radius: 20px;
-            margin-bottom: 2rem;
-            box-shadow: 0 10px 30px rgba(102, 126, 234, 0.4);
-            position: relative;
-            overflow: hidden;
-        }
-        
-        .main-header::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: linear-gradient(45deg, transparent 30%, rgba(255,255,255,0.1) 50%, transparent 70%);
-            animation: shimmer 3s infinite;
-        }
-        
-        @keyframes shimmer {
-            0% { transform: translateX(-100%); }
-            100% { transform: translateX(100%); }
-        }
-        
-        .main-header h1 {
-            color: #ffffff !important;
-            text-shadow: 2px 2px 8px rgba(0,0,0,0.5);
-            font-size: 3rem !important;
-            margin-bottom: 0.5rem !important;
-        }
-        
-        .main-header p {
-            color: rgba(255,255,255,0.9) !important;
-            font-size: 1.2rem !important;
-            text-shadow: 1px 1px 4px rgba(0,0,0,0.3);
-        }
-        
-        /* Enhanced metric containers */
-        .metric-container {
-            background: linear-gradient(135deg, #1e2139 0%, #2a2d5a 100%);
-            padding: 2rem;
-            border-radius: 15px;
-            border: 1px solid #3d4465;
-            margin: 1rem 0;
-            box-shadow: 0 8px 25px rgba(0,0,0,0.3);
-            transition: all 0.3s ease;
-            position: relative;
-            overflow: hidden;
-        }
-        
-        .metric-container::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            height: 3px;
-            background: linear-gradient(90deg, #00d4aa, #667eea, #764ba2);
-        }
-        
-        .metric-container:hover {
-            transform: translateY(-5px);
-            box-shadow: 0 15px 35px rgba(0,0,0,0.4);
-            border-color: #00d4aa;
-        }
-        
-        .metric-title {
-            font-size: 1.3rem;
-            font-weight: bold;
-            color: #00d4aa;
-            margin-bottom: 0.8rem;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-        }
-        
-        .metric-value {
-            font-size: 2.5rem;
-            font-weight: bold;
-            margin-bottom: 0.5rem;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-        }
-        
-        .metric-subtitle {
-            font-size: 1rem;
-            color: #b8bcc8;
-            opacity: 0.8;
-        }
-        
-        /* Enhanced color scheme for changes */
-        .positive-change {
-            color: #00ff88;
-            text-shadow: 0 0 10px rgba(0, 255, 136, 0.3);
-        }
-        
-        .negative-change {
-            color: #ff4757;
-            text-shadow: 0 0 10px rgba(255, 71, 87, 0.3);
-        }
-        
-        .neutral-change {
-            color: #e8e8e8;
-        }
-        
-        /* Enhanced data summary */
-        .data-summary {
-            background: linear-gradient(135deg, #1e2139 0%, #2a2d5a 100%);
-            padding: 1.5rem;
-            border-radius: 12px;
-            border-left: 4px solid #00d4aa;
-            margin: 1rem 0;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.2);
-            color: #e8e8e8;
-        }
-        
-        /* Enhanced refresh section */
-        .refresh-section {
-            background: linear-gradient(135deg, #1e2139 0%, #2a2d5a 100%);
-            padding: 2rem;
-            border-radius: 15px;
-            margin-bottom: 2rem;
-            text-align: center;
-            box-shadow: 0 8px 25px rgba(0,0,0,0.3);
-            border: 1px solid #3d4465;
-        }
-        
-        .refresh-section h3 {
-            color: #00d4aa !important;
-            margin-bottom: 1rem !important;
-        }
-        
-        /* Enhanced selectbox styling */
-        .stSelectbox > div > div {
-            background-color: #2a2d5a !important;
-            border: 1px solid #3d4465 !important;
-            border-radius: 8px !important;
-            color: #e8e8e8 !important;
-        }
-        
-        .stSelectbox > div > div:hover {
-            border-color: #00d4aa !important;
-        }
-        
-        .stSelectbox label {
-            color: #00d4aa !important;
-            font-weight: bold !important;
-        }
-        
-        /* Enhanced dataframe styling */
-        .stDataFrame {
-            background-color: #1e2139 !important;
-        }
-        
-        .stDataFrame table {
-            background-color: #2a2d5a !important;
-            color: #e8e8e8 !important;
-        }
-        
-        .stDataFrame th {
-            background-color: #1e2139 !important;
-            color: #00d4aa !important;
-            font-weight: bold !important;
-        }
-        
-        .stDataFrame td {
-            background-color: #2a2d5a !important;
-            color: #e8e8e8 !important;
-        }
-        
-        /* Enhanced button styling */
-        .stButton > button {
-            background: linear-gradient(135deg, #00d4aa 0%, #00b894 100%);
-            color: #1a1a2e !important;
-            border: none;
-            border-radius: 12px;
-            padding: 1rem 3rem;
-            font-weight: bold;
-            font-size: 1.1rem;
-            transition: all 0.3s ease;
-            margin: 0 auto;
-            display: block;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            box-shadow: 0 4px 15px rgba(0, 212, 170, 0.3);
-        }
-        
-        .stButton > button:hover {
-            background: linear-gradient(135deg, #00b894 0%, #009975 100%);
-            transform: translateY(-3px);
-            box-shadow: 0 8px 25px rgba(0, 212, 170, 0.5);
-        }
-        
-        .stButton > button:active {
-            transform: translateY(-1px);
-        }
-        
-        .stButton {
-            display: flex;
-            justify-content: center;
-            width: 100%;
-        }
-        
-        /* Enhanced welcome message */
-        .welcome-message {
-            text-align: center;
-            padding: 3rem;
-            background: linear-gradient(135deg, #1e2139 0%, #2a2d5a 100%);
-            border-radius: 20px;
-            margin: 2rem 0;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.3);
-            border: 1px solid #3d4465;
-            color: #e8e8e8;
-        }
-        
-        .welcome-message h2 {
-            color: #00d4aa !important;
-            margin-bottom: 1rem !important;
-        }
-        
-        .welcome-message p {
-            color: #b8bcc8 !important;
-        }
-        
-        /* Text color overrides */
-        .stMarkdown, .stText, p, div, span {
-            color: #e8e8e8 !important;
-        }
-        
-        h1, h2, h3, h4, h5, h6 {
-            color: #00d4aa !important;
-        }
-        
-        .stMetric {
-            background: linear-gradient(135deg, #1e2139 0%, #2a2d5a 100%);
-            padding: 1rem;
-            border-radius: 10px;
-            border: 1px solid #3d4465;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.2);
-        }
-        
-        .stMetric > div {
-            color: #e8e8e8 !important;
-        }
-        
-        .stMetric [data-testid="metric-container"] {
-            background-color: transparent;
-            border: none;
-            padding: 0;
-            box-shadow: none;
-        }
-        
-        /* Enhanced error and info messages */
-        .stAlert {
-            border-radius: 10px;
-            border: 1px solid #3d4465;
-            box-shadow: 0 4px 16px rgba(0,0,0,0.2);
-            background-color: #2a2d5a;
-            color: #e8e8e8;
-        }
-        
-        .stSuccess {
-            background: linear-gradient(135deg, #1e2139 0%, #2a2d5a 100%);
-            border-left: 4px solid #00ff88;
-            color: #e8e8e8;
-        }
-        
-        .stError {
-            background: linear-gradient(135deg, #1e2139 0%, #2a2d5a 100%);
-            border-left: 4px solid #ff4757;
-            color: #e8e8e8;
-        }
-        
-        .stInfo {
-            background: linear-gradient(135deg, #1e2139 0%, #2a2d5a 100%);
-            border-left: 4px solid #00d4aa;
-            color: #e8e8e8;
-        }
-        
-        .stWarning {
-            background: linear-gradient(135deg, #fffbeb 0%, #fefce8 100%);
-            border-left: 4px solid #f59e0b;
-        }
-        </style>
-        """, unsafe_allow_html=True)
+        # st.html injects style-only content directly, skipping the Markdown parser
+        st.html(_DARK_THEME_CSS)
     
     def _render_header(self):
         """Render the dashboard header."""
-        st.markdown("""
+        st.html("""
         <div class="main-header">
             <h1>🌙 Crypto Moon Dashboard</h1>
             <p>Analyzing correlations between cryptocurrency price movements and lunar phases</p>
         </div>
-        """, unsafe_allow_html=True)
+        """)
     
     def _render_controls(self):
         """Render the control section with cryptocurrency selector and refresh button."""
         st.markdown('<div class="refresh-section">', unsafe_allow_html=True)
         
-        # Cryptocurrency selector
-        st.markdown("<h3 style='text-align: center; margin-bottom: 1rem;'>Select Cryptocurrency</h3>", unsafe_allow_html=True)
+        # Cryptocurrency selector, centered by its st-key-crypto_selector rule in the theme CSS
+        st.html("<h3 style='text-align: center; margin-bottom: 1rem;'>Select Cryptocurrency</h3>")
         
-        col1, col2, col3 = st.columns([1, 1, 1])
+        crypto_options = ['Bitcoin', 'Ethereum', 'Solana']
+        crypto_icons = {'Bitcoin': '₿', 'Ethereum': 'Ξ', 'Solana': '◎'}
         
-        with col2:
-            crypto_options = ['Bitcoin', 'Ethereum', 'Solana']
-            crypto_icons = {'Bitcoin': '₿', 'Ethereum': 'Ξ', 'Solana': '◎'}
-            
-            selected_crypto = st.selectbox(
-                "Choose cryptocurrency:",
-                crypto_options,
-                index=crypto_options.index(st.session_state.selected_crypto),
-                format_func=lambda x: f"{crypto_icons.get(x, '●')} {x}",
-                key="crypto_selector"
-            )
-            
-            # Update session state if selection changed
-            if selected_crypto != st.session_state.selected_crypto:
-                st.session_state.selected_crypto = selected_crypto
-                st.session_state.data_loaded = False  # Reset data when crypto changes
-                st.session_state.combined_data = []
-                st.session_state.analysis_results = None
-                st.session_state.error_message = None
+        selected_crypto = st.selectbox(
+            "Choose cryptocurrency:",
+            crypto_options,
+            index=crypto_options.index(st.session_state.selected_crypto),
+            format_func=lambda x: f"{crypto_icons.get(x, '●')} {x}",
+            key="crypto_selector"
+        )
+        
+        # Update session state if selection changed
+        if selected_crypto != st.session_state.selected_crypto:
+            st.session_state.selected_crypto = selected_crypto
+            st.session_state.data_loaded = False  # Reset data when crypto changes
+            st.session_state.combined_data = []
+            st.session_state.soa = None
+            st.session_state.analysis_results = None
+            st.session_state.data_summary = None
+            st.session_state.error_message = None
         
         # Add some spacing
-        st.markdown("<div style='margin: 1rem 0;'></div>", unsafe_allow_html=True)
+        st.html("<div style='margin: 1rem 0;'></div>")
         
-        # Refresh button
-        col1, col2, col3 = st.columns([1, 1, 1])
+        # Refresh button; the theme CSS centers it without a column scaffold
+        # Dynamic button text based on data state
+        if st.session_state.data_loaded:
+            button_text = "🔄 Refresh Data"
+            button_help = f"Fetch latest {st.session_state.selected_crypto} data and recalculate moon phases"
+        else:
+            button_text = "📊 Collect Data"
+            button_help = f"Fetch {st.session_state.selected_crypto} data and calculate moon phases for analysis"
         
-        with col2:
-            # Dynamic button text based on data state
-            if st.session_state.data_loaded:
-                button_text = "🔄 Refresh Data"
-                button_help = f"Fetch latest {st.session_state.selected_crypto} data and recalculate moon phases"
-            else:
-                button_text = "📊 Collect Data"
-                button_help = f"Fetch {st.session_state.selected_crypto} data and calculate moon phases for analysis"
-            
-            if st.button(button_text, key="refresh_button", help=button_help, width='stretch'):
-                self._handle_refresh()
+        if st.button(button_text, key="refresh_button", help=button_help, width='content'):
+            self._handle_refresh()
         
         # Display last refresh time and selected crypto
         if st.session_state.last_refresh:
-            st.markdown(f"<p style='text-align: center; color: #cccccc; margin-top: 0.5rem;'>Last updated: {st.session_state.last_refresh.strftime('%Y-%m-%d %H:%M:%S')} ({st.session_state.selected_crypto})</p>", unsafe_allow_html=True)
+            st.html(f"<p style='text-align: center; color: #cccccc; margin-top: 0.5rem;'>Last updated: {st.session_state.last_refresh.strftime('%Y-%m-%d %H:%M:%S')} ({st.session_state.selected_crypto})</p>")
         
         st.markdown('</div>', unsafe_allow_html=True)
     
@@ -462,10 +686,18 @@ class DashboardUI:
             with st.spinner(f"🚀 Fetching {selected_crypto} data and calculating moon phases..."):
                 status_text.text("📡 Connecting to Bybit API...")
                 progress_bar.progress(20)
+                
+                # Start the moon phase calculation for the expected dates while the API call is in flight
+                predicted_dates = _predict_kline_dates(_KLINE_LIMIT)
+                moon_future = _get_executor().submit(
+                    self.moon_calculator.calculate_moon_phases_for_dates,
+                    list(predicted_dates)
+                )
+                
                 # Fetch cryptocurrency data
                 status_text.text(f"💰 Fetching {selected_crypto} price data...")
                 progress_bar.progress(40)
-                crypto_data = self.crypto_client.fetch_crypto_data(selected_crypto, limit=1000)
+                crypto_data = _load_crypto(selected_crypto, _KLINE_LIMIT, int(time.time() // 3600))
                 
                 if not crypto_data:
                     progress_bar.empty()
@@ -476,8 +708,13 @@ class DashboardUI:
                 # Calculate moon phases
                 status_text.text("🌙 Calculating lunar phases...")
                 progress_bar.progress(60)
-                dates = [data.date for data in crypto_data]
-                moon_data = self.moon_calculator.calculate_moon_phases_for_dates(dates)
+                dates = tuple(data.date for data in crypto_data)
+                speculative_moon_data = moon_future.result()
+                if dates == predicted_dates and len(speculative_moon_data) == len(dates):
+                    moon_data = speculative_moon_data
+                else:
+                    # The calculator memoizes per date, so only unpredicted dates are computed here
+                    moon_data = _moon_for_dates_cached(dates)
                 
                 if not moon_data:
                     progress_bar.empty()
@@ -504,13 +741,18 @@ class DashboardUI:
                 # Perform correlation analysis
                 status_text.text("🔍 Performing correlation analysis...")
                 progress_bar.progress(95)
-                analysis_results = self.correlation_analyzer.analyze_correlation(combined_data_with_changes)
+                soa = self.data_processor.get_soa_view()
+                analysis_results = _analyze_cached(soa)
                 
                 # Update session state
                 status_text.text("✅ Finalizing dashboard...")
                 progress_bar.progress(100)
                 st.session_state.combined_data = combined_data_with_changes
+                st.session_state.soa = soa
+                st.session_state.data_version += 1
                 st.session_state.analysis_results = analysis_results
+                # Summarize once per load so the summary tiles and metrics are plain lookups on reruns
+                st.session_state.data_summary = self.data_processor.get_data_summary()
                 st.session_state.data_loaded = True
                 st.session_state.last_refresh = datetime.now()
                 
@@ -523,8 +765,7 @@ class DashboardUI:
                 # Show success message
                 st.success(f"🎉 Successfully loaded {len(combined_data_with_changes)} days of {selected_crypto} data with {analysis_results.full_moon_count} full moon periods!")
                 
-                # Force rerun to update the display
-                st.rerun()
+                # No rerun needed: render_dashboard checks data_loaded after the controls
                 
         except Exception as e:
             error_msg = f"Failed to refresh data: {str(e)}"
@@ -540,10 +781,18 @@ class DashboardUI:
         # Create chart
         try:
             selected_crypto = st.session_state.selected_crypto
-            fig = self.chart_renderer.create_complete_chart(
-                st.session_state.combined_data,
-                title=f"{selected_crypto} Price vs Moon Phases"
-            )
+            combined_data = st.session_state.combined_data
+            title = f"{selected_crypto} Price vs Moon Phases"
+            
+            # Rebuild the figure only when the data or title changed since the last run
+            chart_key = (st.session_state.data_version, title)
+            if st.session_state.get('chart_key') != chart_key:
+                st.session_state.chart_figure = self.chart_renderer.create_complete_chart(
+                    combined_data,
+                    title=title
+                )
+                st.session_state.chart_key = chart_key
+            fig = st.session_state.chart_figure
             
             # Display chart
             st.plotly_chart(
@@ -608,13 +857,13 @@ class DashboardUI:
         
         # Display difference
         difference = results.difference
-        st.markdown(f"""
+        st.html(f"""
         <div class="metric-container">
             <div class="metric-title">Difference</div>
             <div class="metric-value {self._get_change_class(difference)}">{difference:+.2f}%</div>
             <div class="metric-subtitle">Full moon days vs normal days</div>
         </div>
-        """, unsafe_allow_html=True)
+        """)
         
         # Display interpretation
         summary = self.correlation_analyzer.generate_summary_statistics(results)
@@ -623,144 +872,122 @@ class DashboardUI:
     
     def _render_metric_card(self, title: str, value: str, subtitle: str, value_class: str = "neutral-change"):
         """Render a metric card with styling."""
-        st.markdown(f"""
+        st.html(f"""
         <div class="metric-container">
             <div class="metric-title">{title}</div>
             <div class="metric-value {value_class}">{value}</div>
             <div class="metric-subtitle">{subtitle}</div>
         </div>
-        """, unsafe_allow_html=True)
+        """)
     
     def _get_change_class(self, change: float) -> str:
         """Get CSS class for price change styling."""
-        if change > 0:
-            return "positive-change"
-        elif change < 0:
-            return "negative-change"
-        else:
+        if change == 0 or math.isnan(change):
             return "neutral-change"
+        return _CLASS_LUT[int(math.copysign(1, change)) + 1]
     
     def _render_data_summary(self):
         """Render data summary information."""
         if not st.session_state.combined_data:
             return
         
-        # Calculate summary directly from session data
+        # Computed in one pass over the processor's columnar arrays when the data was loaded
         combined_data = st.session_state.combined_data
-        total_points = len(combined_data)
-        points_with_price_change = sum(1 for point in combined_data if point.price_change is not None)
-        full_moon_points = sum(1 for point in combined_data if point.moon_data.is_full_moon)
-        normal_day_points = total_points - full_moon_points
+        summary = st.session_state.data_summary or self.data_processor.get_data_summary()
+        total_points = summary['total_points']
+        points_with_price_change = summary['points_with_price_change']
+        full_moon_points = summary['full_moon_points']
+        normal_day_points = summary['normal_day_points']
         
         st.markdown("## 📈 Data Summary")
         
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("Total Data Points", total_points)
-        
-        with col2:
-            st.metric("Full Moon Days", full_moon_points)
-        
-        with col3:
-            st.metric("Normal Days", normal_day_points)
-        
-        with col4:
-            st.metric("Price Changes Calculated", points_with_price_change)
+        # One HTML element instead of four column and metric widgets
+        st.html(f"""
+        <div class="metric-grid">
+            <div class="metric-container">
+                <div class="metric-title">Total Data Points</div>
+                <div class="metric-value">{total_points}</div>
+            </div>
+            <div class="metric-container">
+                <div class="metric-title">Full Moon Days</div>
+                <div class="metric-value">{full_moon_points}</div>
+            </div>
+            <div class="metric-container">
+                <div class="metric-title">Normal Days</div>
+                <div class="metric-value">{normal_day_points}</div>
+            </div>
+            <div class="metric-container">
+                <div class="metric-title">Price Changes Calculated</div>
+                <div class="metric-value">{points_with_price_change}</div>
+            </div>
+        </div>
+        """)
         
         # Additional summary info
         if st.session_state.analysis_results:
             results = st.session_state.analysis_results
             full_moon_percentage = results.full_moon_percentage
             
-            st.markdown(f"""
+            st.html(f"""
             <div class="data-summary">
                 <strong>Dataset Overview:</strong><br>
                 • Full moon days represent {full_moon_percentage:.1f}% of the dataset<br>
                 • Analysis covers {results.total_data_points} days with price change data<br>
                 • Data spans from {combined_data[0].date.strftime('%Y-%m-%d')} to {combined_data[-1].date.strftime('%Y-%m-%d')}
             </div>
-            """, unsafe_allow_html=True)
+            """)
         
         # Add Full Moon Table
-        self._render_full_moon_table()
+        self._render_full_moon_table(summary)
     
-    def _render_full_moon_table(self):
-        """Render a table showing full moon dates with prices and changes."""
+    def _render_full_moon_table(self, summary: Dict[str, Any]):
+        """
+        Render a table showing full moon dates with prices and changes.
+        
+        Args:
+            summary: Data summary from DataProcessor.get_data_summary
+        """
         if not st.session_state.combined_data:
             return
         
-        # Filter full moon data
-        full_moon_data = [
-            point for point in st.session_state.combined_data 
-            if point.moon_data.is_full_moon and point.price_change is not None
-        ]
+        count = summary['full_moon_with_change']
         
-        if not full_moon_data:
+        if count == 0:
             st.info("No full moon data with price changes available.")
             return
         
         st.markdown("## 🌕 Full Moon Analysis Table")
         
-        # Create table data with enhanced formatting
-        table_data = []
-        for point in full_moon_data:
-            # Format date with day of week
-            date_str = point.date.strftime('%Y-%m-%d (%a)')
-            
-            # Format price change with emoji indicators
-            change_val = point.price_change
-            if change_val > 0:
-                change_str = f"📈 +{change_val:.2f}%"
-            elif change_val < 0:
-                change_str = f"📉 {change_val:.2f}%"
-            else:
-                change_str = f"➡️ {change_val:.2f}%"
-            
-            table_data.append({
-                "🗓️ Date": date_str,
-                "🌕 Moon Phase": f"{point.moon_data.phase_percentage:.1f}%",
-                f"💰 {st.session_state.selected_crypto} Price": f"${point.crypto_data.close_price:,.2f}",
-                "📊 Price Change": change_str,
-                "📈 Volume": f"{point.crypto_data.volume:,.0f}"
-            })
-        
-        # Display as dataframe with custom styling
-        import pandas as pd
-        df = pd.DataFrame(table_data)
-        
-        # Style the dataframe
-        def style_price_change(val):
-            if isinstance(val, str) and '%' in val:
-                # Extract numeric value from formatted string
-                num_str = val.replace('📈', '').replace('📉', '').replace('➡️', '').replace('%', '').replace('+', '').strip()
-                try:
-                    num_val = float(num_str)
-                    if num_val > 0:
-                        return 'color: #00ff88; font-weight: bold; background-color: rgba(0, 255, 136, 0.1);'
-                    elif num_val < 0:
-                        return 'color: #ff4757; font-weight: bold; background-color: rgba(255, 71, 87, 0.1);'
-                except ValueError:
-                    pass
-            return 'color: #e8e8e8;'
-        
-        styled_df = df.style.map(style_price_change, subset=['📊 Price Change'])
+        # Formatting only runs when the data or the selected crypto changed since the last render
+        table_key = (st.session_state.data_version, st.session_state.selected_crypto)
+        if st.session_state.get('table_key') != table_key:
+            # Filter full moon days with a price change as one mask over the columnar arrays
+            soa = st.session_state.soa
+            full_moon_mask = soa.is_full_moon & ~np.isnan(soa.price_change)
+            st.session_state.table_df = self._build_full_moon_table(soa, full_moon_mask)
+            st.session_state.table_key = table_key
         
         st.dataframe(
-            styled_df,
+            st.session_state.table_df,
             width='stretch',
-            hide_index=True
+            hide_index=True,
+            column_config={
+                "🌕 Moon Phase": st.column_config.NumberColumn(format="%.1f%%"),
+                self._price_column_label(): st.column_config.NumberColumn(format="dollar"),
+                "📊 Price Change": st.column_config.NumberColumn(format="%+.2f%%"),
+                "📈 Volume": st.column_config.NumberColumn(format="localized")
+            }
         )
         
         # Enhanced summary stats for full moon days
-        if len(full_moon_data) > 0:
-            avg_change = sum(point.price_change for point in full_moon_data) / len(full_moon_data)
-            positive_days = sum(1 for point in full_moon_data if point.price_change > 0)
-            negative_days = sum(1 for point in full_moon_data if point.price_change < 0)
-            neutral_days = len(full_moon_data) - positive_days - negative_days
+        if count > 0:
+            avg_change = summary['full_moon_avg_change']
+            positive_days = summary['full_moon_positive']
+            negative_days = summary['full_moon_negative']
+            neutral_days = count - positive_days - negative_days
             
             # Calculate win rate
-            win_rate = (positive_days / len(full_moon_data)) * 100
+            win_rate = (positive_days / count) * 100
             
             st.markdown("### 🌕 Full Moon Performance Summary")
             
@@ -776,29 +1003,41 @@ class DashboardUI:
                 st.metric(
                     "🎯 Win Rate", 
                     f"{win_rate:.1f}%",
-                    delta=f"{positive_days}/{len(full_moon_data)} days"
+                    delta=f"{positive_days}/{count} days"
                 )
             with col3:
                 st.metric("📈 Positive Days", positive_days)
             with col4:
                 st.metric("📉 Negative Days", negative_days)
     
+    def _build_full_moon_table(self, soa: SoAView, full_moon_mask: np.ndarray):
+        """
+        Build the full moon table from the columnar data.
+        
+        Args:
+            soa: Columnar view of the combined data
+            full_moon_mask: Mask selecting full moon days with a price change
+        
+        Returns:
+            pandas DataFrame with typed numeric columns
+        """
+        # Numeric columns stay typed; formatting happens in the frontend via column_config
+        import pandas as pd
+        return pd.DataFrame({
+            "🗓️ Date": pd.to_datetime(pd.Series(soa.dates[full_moon_mask])).dt.strftime('%Y-%m-%d (%a)'),
+            "🌕 Moon Phase": soa.phase_pct[full_moon_mask],
+            self._price_column_label(): soa.close[full_moon_mask],
+            "📊 Price Change": soa.price_change[full_moon_mask],
+            "📈 Volume": np.rint(soa.volume[full_moon_mask]).astype(np.int64)
+        })
+    
+    def _price_column_label(self) -> str:
+        """Get the label of the price column for the selected cryptocurrency."""
+        return f"💰 {st.session_state.selected_crypto} Price"
+    
     def _render_welcome_message(self):
         """Render welcome message when no data is loaded."""
-        selected_crypto = st.session_state.selected_crypto
-        st.markdown(f"""
-        <div class="welcome-message">
-            <h2>Welcome to Crypto Moon Dashboard</h2>
-            <p>Select your preferred cryptocurrency above and click "Collect Data" to fetch the latest {selected_crypto} price data and begin analyzing correlations with lunar phases.</p>
-            <p>The dashboard will display:</p>
-            <ul style="text-align: left; display: inline-block;">
-                <li>Interactive {selected_crypto} price chart with full moon indicators</li>
-                <li>Comparative analysis of price changes on full moon vs normal days</li>
-                <li>Statistical insights and data summaries</li>
-            </ul>
-            <p><strong>Supported Cryptocurrencies:</strong> Bitcoin (₿), Ethereum (Ξ), Solana (◎)</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(_WELCOME_HTML[st.session_state.selected_crypto])
     
     def render_error_handling(self, error_message: str):
         """Render user-friendly error messages."""
@@ -0,0 +1 @@
+# Test suite for the Crypto Moon Dashboard
@@ -0,0 +1,111 @@
+"""
+Tests for the CryptoDataClient disk cache and delta fetch.
+"""
+
+import json
+import os
+import time
+from datetime import datetime
+
+import pytest
+import requests
+
+from data_access.bitcoin_client import CryptoDataClient, CryptoPriceData
+
+DAY_MS = 86_400_000
+TODAY_MS = int(time.time()) // 86400 * 86400 * 1000
+LIMIT = 10
+
+
+def _kline(day: int, close: float = 100.0):
+    """Build a raw Bybit kline row for the UTC day `day` days before today."""
+    return [str(TODAY_MS - day * DAY_MS), '100', '110', '90', str(close), '5', '500']
+
+
+def _point(day: int, close: float = 100.0) -> CryptoPriceData:
+    """Build the parsed form of _kline(day, close)."""
+    return CryptoPriceData(
+        date=datetime.fromtimestamp((TODAY_MS - day * DAY_MS) / 1000),
+        open_price=100.0,
+        high_price=110.0,
+        low_price=90.0,
+        close_price=close,
+        volume=5.0,
+        symbol='BTCUSDT'
+    )
+
+
+class _StubSession:
+    """Stand-in for session.get that records params and serves fixed kline rows."""
+    
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+    
+    def __call__(self, url, params=None, timeout=None):
+        self.calls.append(dict(params))
+        response = requests.Response()
+        response.status_code = 200
+        # Bybit returns newest candles first
+        response._content = json.dumps({
+            'retCode': 0,
+            'result': {'list': list(reversed(self.rows))}
+        }).encode()
+        return response
+
+
+@pytest.fixture
+def client(tmp_path):
+    """Client whose disk cache holds LIMIT candles ending three days ago."""
+    client = CryptoDataClient(cache_dir=tmp_path)
+    cached = [_point(day) for day in range(LIMIT + 2, 2, -1)]
+    client.price_store.save(client._cache_key('BTCUSDT', LIMIT), cached)
+    return client
+
+
+def _age_cache(client):
+    """Make the cached file older than the client's freshness window."""
+    path = client.price_store.path_for(client._cache_key('BTCUSDT', LIMIT))
+    stale = time.time() - client.DISK_CACHE_TTL - 60
+    os.utime(path, (stale, stale))
+
+
+def test_fresh_cache_is_served_without_a_request(client, monkeypatch):
+    stub = _StubSession([])
+    monkeypatch.setattr(client.session, 'get', stub)
+    
+    data = client.fetch_crypto_data('Bitcoin', LIMIT)
+    
+    assert stub.calls == []
+    assert data == [_point(day) for day in range(LIMIT + 2, 2, -1)]
+
+
+def test_stale_cache_fetches_delta_and_merges(client, monkeypatch):
+    _age_cache(client)
+    # The last cached day comes back with its final close, followed by three new days
+    stub = _StubSession([_kline(day, close=105.0) for day in range(3, -1, -1)])
+    monkeypatch.setattr(client.session, 'get', stub)
+    
+    data = client.fetch_crypto_data('Bitcoin', LIMIT)
+    
+    assert len(stub.calls) == 1
+    assert stub.calls[0]['start'] == TODAY_MS - 3 * DAY_MS
+    assert data == [_point(day) for day in range(LIMIT - 1, 3, -1)] + [
+        _point(day, close=105.0) for day in range(3, -1, -1)
+    ]
+    assert client.price_store.is_fresh(client._cache_key('BTCUSDT', LIMIT), client.DISK_CACHE_TTL)
+
+
+def test_empty_delta_returns_cached_data(client, monkeypatch):
+    _age_cache(client)
+    monkeypatch.setattr(client.session, 'get', _StubSession([]))
+    
+    assert client.fetch_crypto_data('Bitcoin', LIMIT) == [_point(day) for day in range(LIMIT + 2, 2, -1)]
+
+
+def test_all_invalid_delta_returns_cached_data(client, monkeypatch):
+    _age_cache(client)
+    # A close above the high fails validation
+    monkeypatch.setattr(client.session, 'get', _StubSession([_kline(day, close=500.0) for day in range(3, -1, -1)]))
+    
+    assert client.fetch_crypto_data('Bitcoin', LIMIT) == [_point(day) for day in range(LIMIT + 2, 2, -1)]
@@ -0,0 +1,69 @@
+"""
+Tests for the DataProcessor cache and columnar views.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from business_logic.data_processor import DataProcessor, CombinedDataPoint
+from data_access.bitcoin_client import CryptoPriceData
+from data_access.moon_calculator import MoonPhaseData
+
+
+def _make_points(count: int = 5):
+    """Build consecutive daily combined points without price changes."""
+    start = datetime(2024, 1, 1)
+    points = []
+    for i in range(count):
+        day = start + timedelta(days=i)
+        price = 100.0 + i
+        points.append(CombinedDataPoint(
+            date=day,
+            crypto_data=CryptoPriceData(day, price, price, price, price, 1.0, 'BTCUSDT'),
+            moon_data=MoonPhaseData(date=day, phase_percentage=50.0)
+        ))
+    return points
+
+
+def test_store_data_rebuilds_columns_after_points_are_mutated():
+    processor = DataProcessor()
+    points = _make_points()
+    processor.store_data(points)
+    assert processor.get_data_summary()['points_with_price_change'] == 0
+    
+    for point in points:
+        point.price_change = 1.0
+        point.moon_data.phase_percentage = 99.0
+    processor.store_data(list(points))
+    
+    summary = processor.get_data_summary()
+    assert summary['points_with_price_change'] == 5
+    assert summary['full_moon_points'] == 5
+    assert processor.get_soa_view().price_change.tolist() == [1.0] * 5
+
+
+@pytest.mark.parametrize('chunk_days', [1, 7, 30, 365])
+def test_combine_data_chunked_matches_combine_data(chunk_days):
+    rng = random.Random(chunk_days)
+    start = datetime(2024, 1, 1)
+    for _ in range(50):
+        # Sorted inputs with gaps, several points per day and repeated moon days
+        crypto_data = sorted((
+            CryptoPriceData(start + timedelta(days=rng.randint(0, 120), hours=rng.randint(0, 23)),
+                            1.0, 1.0, 1.0, 1.0, 1.0, 'BTCUSDT')
+            for _ in range(rng.randint(1, 80))
+        ), key=lambda point: point.date)
+        moon_data = sorted((
+            MoonPhaseData(date=start + timedelta(days=rng.randint(0, 120), hours=rng.randint(0, 23)),
+                          phase_percentage=rng.uniform(0, 100))
+            for _ in range(rng.randint(1, 80))
+        ), key=lambda point: point.date)
+        
+        expected = DataProcessor().combine_data(crypto_data, moon_data)
+        chunked = list(DataProcessor().combine_data_chunked(crypto_data, moon_data, chunk_days=chunk_days))
+        
+        assert [(point.crypto_data, point.moon_data) for point in chunked] == [
+            (point.crypto_data, point.moon_data) for point in expected
+        ]